@@ -1,9 +1,19 @@
 import os
+import sys
 import json
+import string
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from typing import Dict, Any
 from pyairtable import Api
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib encoder
+    orjson = None
+
 load_dotenv()
 
 # SEO templates for all country chart types
@@ -11,8 +21,6 @@ seo_templates = {
     "key stats": {
         "SEO-title":
         "{country}'s government Key Stats table",
-        "sandbox":
-        "allow-same-origin allow-forms allow-scripts allow-downloads allow-popups allow-popups-to-escape-sandbox allow-top-navigation-by-user-activation",
         "SEO-figcaption":
         "Key statistics table displaying core political and economic data, including key indicators such as population, GDP, government structure, and democracy metrics in {country}.",
         "SEO-description":
@@ -43,8 +51,6 @@ seo_templates = {
     "democratic history": {
         "SEO-title":
         "{country} Historical and political timeline",
-        "sandbox":
-        "allow-same-origin allow-forms allow-scripts allow-downloads allow-popups allow-popups-to-escape-sandbox allow-top-navigation-by-user-activation",
         "SEO-figcaption":
         "History timeline table outlining significant political and economic events, highlighting major milestones such as independence, regime changes, economic reforms, coup, and key developments an[...]",
         "SEO-description":
@@ -70,8 +76,6 @@ seo_templates = {
     "candidates": {
         "SEO-title":
         "{country} {year} presidential Candidates",
-        "sandbox":
-        "allow-same-origin allow-forms allow-scripts allow-downloads allow-popups allow-popups-to-escape-sandbox allow-top-navigation-by-user-activation",
         "SEO-figcaption":
         "Candidate chart displaying the {year} {country} presidential candidates, with key data covering their background, political alignment, and government experience.",
         "SEO-description":
@@ -95,8 +99,6 @@ seo_templates = {
     "parliament": {
         "SEO-title":
         "{country} {year} parliament chart",
-        "sandbox":
-        "allow-same-origin allow-forms allow-scripts allow-downloads allow-popups allow-popups-to-escape-sandbox allow-top-navigation-by-user-activation",
         "SEO-figcaption":
         "Interactive parliamentary election chart displaying the {year} {country} parliamentary election results, illustrating the distribution of seats by political parties.",
         "SEO-description":
@@ -129,8 +131,6 @@ seo_templates = {
     "voting metrics": {
         "SEO-title":
         "{country} Voter metrics chart",
-        "sandbox":
-        "allow-same-origin allow-forms allow-scripts allow-downloads allow-popups allow-popups-to-escape-sandbox allow-top-navigation-by-user-activation",
         "SEO-figcaption":
         "Interactive voting metrics chart displaying the {country} presidential election results, with percentage of registered voters who voted and percentage invalid votes across election years.",
         "SEO-description":
@@ -173,8 +173,6 @@ seo_templates = {
     "bar": {
         "SEO-title":
         "{country} {year} total result bar chart",
-        "sandbox":
-        "allow-same-origin allow-forms allow-scripts allow-downloads allow-popups allow-popups-to-escape-sandbox allow-top-navigation-by-user-activation",
         "SEO-figcaption":
         "Bar chart displaying the {year} {country} presidential election results, illustrating how each coalition party performed in terms of percentage of votes received.",
         "SEO-description":
@@ -215,8 +213,6 @@ seo_templates = {
     "map": {
         "SEO-title":
         "{country} {year} presidential election map",
-        "sandbox":
-        "allow-same-origin allow-forms allow-scripts allow-downloads allow-popups allow-popups-to-escape-sandbox allow-top-navigation-by-user-activation",
         "SEO-figcaption":
         "Interactive map chart displaying the {year} {country} presidential election results, illustrating how each party and/or candidate performed by region based on the number of votes received acr[...]",
         "SEO-description":
@@ -259,8 +255,6 @@ seo_templates = {
     "election integrity": {
         "SEO-title":
         "{country} Election Integrity Chart",
-        "sandbox":
-        "allow-same-origin allow-forms allow-scripts allow-downloads allow-popups allow-popups-to-escape-sandbox allow-top-navigation-by-user-activation",
         "SEO-figcaption":
         "Election integrity chart displaying observer group estimates, official electoral body data, and discrepancies in vote counts, highlighting areas of potential irregularities or alignment betwe[...]",
         "SEO-description":
@@ -297,6 +291,10 @@ seo_templates = {
     }
 }
 
+# Fields every SEO template provides. The iframe sandbox attribute is the same
+# for every chart, so the page templates carry it instead of each section.
+SEO_FIELDS = ("SEO-title", "SEO-figcaption", "SEO-description", "SEO-keywords")
+
 # Alias mapping for chart types found in a.json to the seo templates
 charttype_aliases = {
     "key stats": "key stats",
@@ -317,97 +315,191 @@ charttype_aliases = {
     "election representativeness": "election integrity",
 }
 
+# Airtable tables backing each extractor, in its argument order
+COUNTRY_TABLES = ("Pages", "Tabs", "Subtabs", "Sections")
+DEMOCRACY_TABLES = ("Democracy-pages", "Democracy-tabs", "Democracy-subtabs",
+                    "Democracy-sections")
+
 def parse_seo_keywords(seo_keywords):
     if seo_keywords and isinstance(seo_keywords, str):
         return [kw.strip() for kw in seo_keywords.split(",") if kw.strip()]
     return seo_keywords  # already a list or None
 
-def fill_seo_fields(section_data, charttype, country, year):
-    charttype_key = charttype_aliases.get(charttype.lower(), charttype.lower())
-    template = seo_templates.get(charttype_key)
-    if not template:
-        return section_data
+_formatter = string.Formatter()
+
+def compile_seo_template(value):
+    """Find a template's placeholders once, so rendering is a short replace chain"""
+    field_names = dict.fromkeys(
+        field_name for _, field_name, _, _ in _formatter.parse(value)
+        if field_name is not None)
+    if not field_names:
+        return lambda replacements: value
+    placeholders = [("{" + name + "}", name) for name in field_names]
+
+    def render(replacements):
+        result = value
+        for placeholder, field_name in placeholders:
+            result = result.replace(placeholder, str(replacements[field_name]))
+        return result
+
+    return render
+
+def compile_seo_value(value):
+    if isinstance(value, list):
+        renders = [compile_seo_template(v) for v in value]
+        return lambda replacements: [render(replacements) for render in renders]
+    return compile_seo_template(value)
+
+# Templates compiled once at import, so sections only pay for substitution
+compiled_seo_templates = {
+    charttype_key: {
+        seo_field: compile_seo_value(value)
+        for seo_field, value in template.items()
+    }
+    for charttype_key, template in seo_templates.items()
+}
 
+class SEOKeywords(list):
+    """A rendered keyword list that also carries its own serialized JSON"""
+    __slots__ = ("fragment",)
+
+    def __init__(self, keywords):
+        super().__init__(keywords)
+        # orjson splices this in verbatim instead of re-encoding the list for
+        # every section that shares it (Fragment needs orjson 3.9+)
+        self.fragment = (orjson.Fragment(orjson.dumps(self))
+                         if hasattr(orjson, "Fragment") else None)
+
+def _encode_extra(obj):
+    if isinstance(obj, SEOKeywords):
+        return obj.fragment if obj.fragment is not None else list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+@lru_cache(maxsize=2048)
+def _render_seo(charttype_key, country, year):
+    """Rendered SEO fields for one (chart type, country, year) as (field, value) pairs.
+
+    Keyword lists are shared by every section with the same key and must not be
+    mutated; keywords are interned since many repeat across chart types.
+    """
+    template = compiled_seo_templates[charttype_key]
+
+    year_int = int(year) if year and year.isdigit() else None
+    if year_int is None:
+        year_plus_5 = year_plus_10 = prev_year = ""
+    else:
+        year_plus_5 = str(year_int + 5)
+        year_plus_10 = str(year_int + 10)
+        prev_year = str(year_int - 5)
     replacements = {
         "country": country,
         "year": year,
-        "year_plus_5": str(int(year) + 5) if year and year.isdigit() else "",
-        "year_plus_10": str(int(year) + 10) if year and year.isdigit() else "",
-        "prev_year": str(int(year) - 5) if year and year.isdigit() else "",
-        "next_year": str(int(year) + 5) if year and year.isdigit() else "",
+        "year_plus_5": year_plus_5,
+        "year_plus_10": year_plus_10,
+        "prev_year": prev_year,
+        "next_year": year_plus_5,
     }
-    for key, value in template.items():
-        seo_field = key
+    rendered = []
+    for seo_field, render in template.items():
+        value = render(replacements)
+        if isinstance(value, list):
+            value = SEOKeywords(sys.intern(keyword) for keyword in value)
+        rendered.append((seo_field, value))
+    return tuple(rendered)
+
+# Every lowercase Charttype with a template, resolved to its template key
+charttype_keys = {
+    **{charttype_key: charttype_key for charttype_key in seo_templates},
+    **{
+        alias: target
+        for alias, target in charttype_aliases.items()
+        if target in seo_templates
+    },
+}
+
+def resolve_charttype_key(charttype):
+    """Map a section's Charttype to its seo_templates key, or None if it has none"""
+    return charttype_keys.get(charttype.lower())
+
+def fill_seo_fields(section_data, charttype_key, country, year):
+    if charttype_key is None:
+        return section_data
+    # Editors usually fill these in Airtable, leaving nothing to render
+    if all(section_data.get(seo_field) for seo_field in SEO_FIELDS):
+        return section_data
+    for seo_field, value in _render_seo(charttype_key, country, year):
         if not section_data.get(seo_field):
-            if isinstance(value, str):
-                section_data[seo_field] = value.format(**replacements)
-            elif isinstance(value, list):
-                section_data[seo_field] = [
-                    v.format(**replacements) for v in value
-                ]
+            section_data[seo_field] = value
     return section_data
 
-def extract_country_data(base) -> Dict[str, Any]:
-    pages = base.table("Pages").all()
-    tabs = base.table("Tabs").all()
-    subtabs = base.table("Subtabs").all()
-    sections = base.table("Sections").all()
-
-    tab_lookup = {t["id"]: t for t in tabs}
-    subtab_lookup = {s["id"]: s for s in subtabs}
-    section_lookup = {s["id"]: s for s in sections}
+def extract_country_data(pages, tabs, subtabs, sections) -> Dict[str, Any]:
+    # Lookups keep only the fields of published records, so unpublished ones
+    # are filtered once here rather than every time they are referenced
+    tab_lookup = {
+        t["id"]: t["fields"]
+        for t in tabs if t["fields"].get("PublishStatus")
+    }
+    subtab_lookup = {
+        s["id"]: s["fields"]
+        for s in subtabs if s["fields"].get("SubtabShow")
+    }
+    section_lookup = {
+        s["id"]: s["fields"]
+        for s in sections if s["fields"].get("ShowSection") == "Yes"
+    }
+    published_pages = [
+        page["fields"] for page in pages if page["fields"].get("PublishStatus")
+    ]
+    # Bound once for the nested loops below
+    get_tab = tab_lookup.get
+    get_subtab = subtab_lookup.get
+    get_section = section_lookup.get
 
     result = {}
 
-    for page in pages:
-        fields = page["fields"]
-        if not fields.get("PublishStatus"):
-            continue
-
+    for fields in published_pages:
         page_id = fields.get("PageID")
         tab_ids = fields.get("TabID", [])
-        country_data = {"page_fields": fields.copy(), "tabs": []}
+        country = fields.get("Country", "")
+        country_data = {"page_fields": fields, "tabs": []}
 
         for tab_id in tab_ids:
-            tab = tab_lookup.get(tab_id)
-            if not tab or not tab["fields"].get("PublishStatus"):
+            tab_fields = get_tab(tab_id)
+            if tab_fields is None:
                 continue
 
-            tab_fields = tab["fields"]
             subtab_ids = tab_fields.get("SubtabID", [])
-            tab_data = {"tab_fields": tab_fields.copy(), "subtabs": []}
+            tab_data = {"tab_fields": tab_fields, "subtabs": []}
 
             # Build all subtabs first
             built_subtabs = []
             for subtab_id in subtab_ids:
-                subtab = subtab_lookup.get(subtab_id)
-                if not subtab or not subtab["fields"].get("SubtabShow"):
+                subtab_fields = get_subtab(subtab_id)
+                if subtab_fields is None:
                     continue
 
-                subtab_fields = subtab["fields"]
                 section_ids = subtab_fields.get("SectionID", [])
-                subtab_data = {
-                    "subtab_fields": subtab_fields.copy(),
-                    "sections": []
-                }
+                subtab_data = {"subtab_fields": subtab_fields, "sections": []}
+                append_section = subtab_data["sections"].append
 
                 for section_id in section_ids:
-                    section = section_lookup.get(section_id)
-                    if not section or section["fields"].get(
-                            "ShowSection") != "Yes":
+                    section_fields = get_section(section_id)
+                    if section_fields is None:
                         continue
 
-                    section_data = section["fields"].copy()
-                    section_data["SEO-keywords"] = parse_seo_keywords(
-                        section_data.get("SEO-keywords"))
-                    section_data["ChartTitle"] = section_data.get(
-                        "ChartTitle", "")
-                    charttype = section_data.get("Charttype", "").lower()
-                    country = fields.get("Country", "")
+                    # Only sections gain keys, so only they need a new dict
+                    section_data = {
+                        **section_fields,
+                        "SEO-keywords":
+                        parse_seo_keywords(section_fields.get("SEO-keywords")),
+                        "ChartTitle": section_fields.get("ChartTitle", ""),
+                    }
+                    charttype_key = resolve_charttype_key(
+                        section_fields.get("Charttype", ""))
                     year = section_data.get("Year", "")
-                    section_data = fill_seo_fields(section_data, charttype,
-                                                   country, year)
-                    subtab_data["sections"].append(section_data)
+                    append_section(
+                        fill_seo_fields(section_data, charttype_key, country,
+                                        year))
 
                 built_subtabs.append(subtab_data)
 
@@ -423,45 +515,23 @@ def extract_country_data(base) -> Dict[str, Any]:
                     candidates_subtab = subtab
 
             if result_subtab and candidates_subtab:
-                # Group candidate sections by year
-                from collections import defaultdict
-                candidate_sections_by_year = defaultdict(list)
-                sections_without_year = []  # For sections that should appear for all years
-                
-                for section in candidates_subtab["sections"]:
+                # Sections without a year appear for all years (like voter
+                # metrics) and lead, then year-specific sections newest first
+                sections_without_year = []
+                sections_with_year = []
+                # Candidate sections come before results (bar, map, etc.)
+                for section in (candidates_subtab["sections"] +
+                                result_subtab["sections"]):
                     year = section.get("Year")
-                    if year and year.strip():  # Only group if year exists and is not empty
-                        candidate_sections_by_year[year].append(section)
+                    if year and year.strip():
+                        sections_with_year.append(section)
                     else:
-                        sections_without_year.append(section)  # These appear for all years
+                        sections_without_year.append(section)
 
-                # Group result sections by year
-                results_sections_by_year = defaultdict(list)
-                results_without_year = []  # For sections that should appear for all years
-                
-                for section in result_subtab["sections"]:
-                    year = section.get("Year")
-                    if year and year.strip():  # Only group if year exists and is not empty
-                        results_sections_by_year[year].append(section)
-                    else:
-                        results_without_year.append(section)  # These appear for all years
-
-                # Get all unique years from sections that have years
-                all_years = set(candidate_sections_by_year) | set(results_sections_by_year)
-                merged_sections = []
-                
-                # First, add sections without years (these appear for all years like voter metrics)
-                merged_sections.extend(sections_without_year)
-                merged_sections.extend(results_without_year)
-                
-                # Then add year-specific sections
-                for year in sorted(all_years, reverse=True):
-                    # Add candidate sections first (if any)
-                    merged_sections.extend(candidate_sections_by_year.get(year, []))
-                    # Then add results sections (bar, map, etc.)
-                    merged_sections.extend(results_sections_by_year.get(year, []))
-                
-                result_subtab["sections"] = merged_sections
+                # Stable sort, so candidates stay ahead of results in a year
+                sections_with_year.sort(key=itemgetter("Year"), reverse=True)
+                result_subtab["sections"] = (sections_without_year +
+                                             sections_with_year)
 
                 # Optionally clear out the candidates subtab
                 candidates_subtab["sections"] = []
@@ -473,66 +543,57 @@ def extract_country_data(base) -> Dict[str, Any]:
 
     return result
 
-def extract_democracy_data(base) -> Dict[str, Any]:
-    pages = base.table("Democracy-pages").all()
-    tabs = base.table("Democracy-tabs").all()
-    subtabs = base.table("Democracy-subtabs").all()
-    sections = base.table("Democracy-sections").all()
+def extract_democracy_data(pages, tabs, subtabs, sections) -> Dict[str, Any]:
+    # Create lookups of record fields keyed by Airtable record IDs
+    tab_lookup = {t["id"]: t["fields"] for t in tabs}
+    subtab_lookup = {s["id"]: s["fields"] for s in subtabs}
+    section_lookup = {s["id"]: s["fields"] for s in sections}
 
-    # Create lookups using Airtable record IDs
-    tab_lookup = {t["id"]: t for t in tabs}
-    subtab_lookup = {s["id"]: s for s in subtabs}
-    section_lookup = {s["id"]: s for s in sections}
+    identified_pages = [
+        page["fields"] for page in pages
+        if page["fields"].get("Democracy-pageID")
+    ]
 
     result = {}
 
-    for page in pages:
-        fields = page["fields"]
-        page_id = fields.get("Democracy-pageID")
-        if not page_id:
-            continue
-
+    for fields in identified_pages:
+        page_id = fields["Democracy-pageID"]
         tab_ids = fields.get("Democracy-tabID", [])
-        page_data = {"page_fields": fields.copy(), "tabs": []}
+        page_data = {"page_fields": fields, "tabs": []}
 
         for tab_id in tab_ids:
-            tab = tab_lookup.get(tab_id)
-            if not tab:
+            tab_fields = tab_lookup.get(tab_id)
+            if tab_fields is None:
                 continue
 
-            tab_fields = tab["fields"]
-            tab_data = {"tab_fields": tab_fields.copy(), "subtabs": []}
+            tab_data = {"tab_fields": tab_fields, "subtabs": []}
 
             # Get subtabs for this tab using Airtable record IDs
             tab_subtab_ids = tab_fields.get("Democracy-subtabID", [])
 
             for subtab_id in tab_subtab_ids:
-                subtab = subtab_lookup.get(subtab_id)
-                if not subtab:
+                subtab_fields = subtab_lookup.get(subtab_id)
+                if subtab_fields is None:
                     continue
 
-                subtab_fields = subtab["fields"]
-                subtab_data = {
-                    "subtab_fields": subtab_fields.copy(),
-                    "sections": []
-                }
+                subtab_data = {"subtab_fields": subtab_fields, "sections": []}
 
                 # Get sections for this subtab using Airtable record IDs
                 subtab_section_ids = subtab_fields.get("Democracy-sectionID",
                                                        [])
 
                 for section_id in subtab_section_ids:
-                    section = section_lookup.get(section_id)
-                    if not section:
+                    section_fields = section_lookup.get(section_id)
+                    if section_fields is None:
                         continue
 
-                    section_fields = section["fields"].copy()
-                    section_fields["SEO-keywords"] = parse_seo_keywords(
-                        section_fields.get("SEO-keywords"))
                     # Ensure Charttitle field is captured
-                    section_fields["Charttitle"] = section_fields.get(
-                        "Charttitle", "")
-                    subtab_data["sections"].append(section_fields)
+                    subtab_data["sections"].append({
+                        **section_fields,
+                        "SEO-keywords":
+                        parse_seo_keywords(section_fields.get("SEO-keywords")),
+                        "Charttitle": section_fields.get("Charttitle", ""),
+                    })
 
                 tab_data["subtabs"].append(subtab_data)
 
@@ -554,13 +615,33 @@ def load_data_from_airtable() -> None:
 
     print("Fetching Airtable data")
 
-    countries = extract_country_data(base)
-    democracy = extract_democracy_data(base)
+    # The table fetches are network-bound, so run them all at once
+    with ThreadPoolExecutor(max_workers=len(COUNTRY_TABLES) +
+                            len(DEMOCRACY_TABLES)) as executor:
+        country_futures = [
+            executor.submit(base.table(name).all) for name in COUNTRY_TABLES
+        ]
+        democracy_futures = [
+            executor.submit(base.table(name).all) for name in DEMOCRACY_TABLES
+        ]
+        countries = extract_country_data(
+            *[future.result() for future in country_futures])
+        democracy = extract_democracy_data(
+            *[future.result() for future in democracy_futures])
 
     combined = {"countries": countries, "democracy": democracy}
     os.makedirs("siteV2/data", exist_ok=True)
-    with open("siteV2/data/africa_pages.json", "w") as f:
-        json.dump(combined, f, indent=2)
+    if orjson:
+        with open("siteV2/data/africa_pages.json", "wb") as f:
+            f.write(
+                orjson.dumps(combined,
+                             default=_encode_extra,
+                             option=orjson.OPT_INDENT_2
+                             | orjson.OPT_PASSTHROUGH_SUBCLASS
+                             | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open("siteV2/data/africa_pages.json", "w") as f:
+            json.dump(combined, f, indent=2)
 
     print("Data written to africa_pages.json")
     return combined
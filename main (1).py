@@ -1,28 +1,61 @@
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.exception_handlers import http_exception_handler
+from fastapi.responses import (FileResponse, HTMLResponse, RedirectResponse,
+                               Response)
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
 import json
 import os
 from datetime import datetime
-from collections import defaultdict
+from enum import IntEnum
+from heapq import merge
+from operator import itemgetter
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:  # fall back to the stdlib parser
+    orjson = None
+
+from .sitemap import generate_sitemap
 
 app = FastAPI()
 app.mount("/static", StaticFiles(directory="siteV2/static"), name="static")
 templates = Jinja2Templates(directory="siteV2/templates")
+# Templates only change with a deploy, so skip the per-render mtime check and
+# keep compiled bytecode between restarts; then load the pages we serve
+templates.env.auto_reload = False
+templates.env.bytecode_cache = FileSystemBytecodeCache()
+for template_name in ("base.html", "tab_page.html"):
+    templates.env.get_template(template_name)
+
+# Set once per process: the footer year and the static asset cache-buster
+started_at = datetime.now()
+current_year = started_at.year
+asset_version = started_at.timestamp()
+
+
+DATA_PATH = "siteV2/data/africa_pages.json"
+_data_cache = {"mtime": None, "data": None}
 
 
 def load_data_from_json():
-    """Load data from the saved JSON file"""
+    """Load data from the saved JSON file, re-parsing only when it changes"""
     try:
-        with open("siteV2/data/africa_pages.json", "r") as f:
-            return json.load(f)
+        mtime = os.stat(DATA_PATH).st_mtime_ns
+        if mtime != _data_cache["mtime"]:
+            with open(DATA_PATH, "rb") as f:
+                raw = f.read()
+            _data_cache["data"] = orjson.loads(raw) if orjson else json.loads(raw)
+            _data_cache["mtime"] = mtime
+        return _data_cache["data"]
     except FileNotFoundError:
         print(
             "JSON data file not found. Please run fetch_data.py to generate it."
         )
         return {"countries": {}, "democracy": {}}
-    except json.JSONDecodeError:
+    except json.JSONDecodeError:  # orjson's decode error subclasses this
         print("Error reading JSON data file.")
         return {"countries": {}, "democracy": {}}
 
@@ -33,6 +66,21 @@ country_data = full_data.get("countries", {})
 democracy_data = full_data.get("democracy", {})
 
 
+class Category(IntEnum):
+    TRACKER = 1
+    DATA = 2
+    DIRECTORY = 3
+    OTHER = 4
+
+
+# Category names as entered in Airtable; anything else is Category.OTHER
+CATEGORY_BY_NAME = {
+    "Election Tracker": Category.TRACKER,
+    "Democracy Data": Category.DATA,
+    "Directory of Country Resources": Category.DIRECTORY,
+}
+
+
 # Organize democracy pages into categories
 def categorize_democracy_pages():
     tracker_pages = {}
@@ -48,108 +96,264 @@ def categorize_democracy_pages():
             tab_fields = page["tabs"][0].get("tab_fields", {})
             category = tab_fields.get("Category", "").strip()
 
-        if category == "Election Tracker":
+        kind = CATEGORY_BY_NAME.get(category, Category.OTHER)
+        if kind is Category.TRACKER:
             tracker_pages[key] = page
-        elif category == "Democracy Data":
+        elif kind is Category.DATA:
             data_pages[key] = page
-        elif category == "Directory of Country Resources":
+        elif kind is Category.DIRECTORY:
             directory_pages[key] = page
 
-    # Sort pages by their Order-tab (convert to int for proper numerical sorting)
-    sorted_tracker_pages = dict(
-        sorted(tracker_pages.items(),
-               key=lambda item: int(item[1]["tabs"][0]["tab_fields"].get(
-                   "TabOrder", "0"))))
-    sorted_data_pages = dict(
-        sorted(data_pages.items(),
-               key=lambda item: int(item[1]["tabs"][0]["tab_fields"].get(
-                   "TabOrder", "0"))))
-    sorted_directory_pages = dict(
-        sorted(directory_pages.items(),
-               key=lambda item: int(item[1]["tabs"][0]["tab_fields"].get(
-                   "TabOrder", "0"))))
+    return (sort_by_tab_order(tracker_pages), sort_by_tab_order(data_pages),
+            sort_by_tab_order(directory_pages))
 
-    return sorted_tracker_pages, sorted_data_pages, sorted_directory_pages
 
+def sort_by_tab_order(pages):
+    # Sort page keys by their Order-tab (convert to int for proper numerical sorting)
+    order = sorted(
+        pages,
+        key=lambda key: int(pages[key]["tabs"][0]["tab_fields"].get(
+            "TabOrder", "0")))
+    return {key: pages[key] for key in order}
 
-def organize_sections_by_year(subtab):
-    year_groups = defaultdict(list)
-    all_years = set()
 
-    for section in subtab["sections"]:
-        year = section.get("Year")
-        if year:
-            all_years.add(str(year))
+# The data is loaded once at import, so categorize and sort it once as well
+tracker_pages, data_pages, directory_pages = categorize_democracy_pages()
+# Sort countries alphabetically by country name
+sorted_countries = dict(
+    sorted(country_data.items(),
+           key=lambda item: item[1]["page_fields"].get("Country", "").lower()))
+# Every page shares the same sidebar, so build its context once too. It is
+# read-only since the same object goes into every template render.
+sidebar = MappingProxyType({
+    "tracker": tracker_pages,
+    "democracy": data_pages,
+    "countries": sorted_countries,
+    "directory": directory_pages
+})
 
-    sorted_years = sorted(all_years, reverse=True)
-    if not sorted_years:
-        sorted_years = ['all']
 
-    # Sort sections by SectionOrder (convert to int for proper numerical sorting)
-    sorted_sections = sorted(
-        subtab["sections"],
-        key=lambda section: int(section.get("SectionOrder", "0")))
+def category_links(pages):
+    """(slug, title, url) of each page, for navigating within a category"""
+    return [(page_slug, page_data["page_fields"].get("Democracy-page", ""),
+             f"/{page_slug}") for page_slug, page_data in pages.items()]
+
+
+tracker_links = category_links(tracker_pages)
+data_links = category_links(data_pages)
+
 
-    for section in sorted_sections:
+def organize_sections_by_year(subtab):
+    # Sort sections by SectionOrder, as coerced by precompute_page_views
+    sorted_sections = sorted(subtab["sections"], key=itemgetter("_order"))
+
+    # Single pass: sections with a year belong to it, the rest to every year.
+    # Positions are kept so each year's list stays in SectionOrder order.
+    dated_sections = {}
+    shared_sections = []
+    for position, section in enumerate(sorted_sections):
         year = section.get("Year")
         if year:
-            year_groups[str(year)].append(section)
+            dated_sections.setdefault(str(year), []).append((position, section))
         else:
-            for y in sorted_years:
-                year_groups[y].append(section)
+            shared_sections.append((position, section))
+
+    sorted_years = sorted(dated_sections, reverse=True)
+    if not sorted_years:
+        sorted_years = ['all']
+
+    year_groups = {
+        year: [
+            section for _, section in merge(dated_sections.get(year, []),
+                                            shared_sections,
+                                            key=itemgetter(0))
+        ]
+        for year in sorted_years
+        # An empty subtab has no groups at all, not an empty 'all' group
+        if year in dated_sections or shared_sections
+    }
 
     return sorted_years, year_groups
 
 
+# Spaces become hyphens and ampersands are dropped, so "Data & History"
+# becomes "data--history"
+SLUG_TABLE = str.maketrans({" ": "-", "&": None})
+
+
+def tab_url_slug(tab_title):
+    return tab_title.lower().translate(SLUG_TABLE)
+
+
+def describe_page(slug, page):
+    """Resolve a page's category, title and tab more-info text once at load"""
+    # Get the category to determine template behavior
+    category = page["page_fields"].get("Category")
+    if not category and page.get("tabs"):
+        # Tabs are sorted by TabOrder, so the first one is the fallback
+        category = page["tabs"][0].get("tab_fields", {}).get("Category", "")
+
+    country_name = page["page_fields"].get("Country")
+    democracy_title = page["page_fields"].get("Democracy-page")
+
+    # Detect if this is a Country Data & History page by presence of Country but no Category
+    is_country_page = bool(country_name) and not bool(category)
+    kind = CATEGORY_BY_NAME.get(category, Category.OTHER)
+
+    if country_name:
+        page_title = f"Democracy in {country_name}"
+    elif kind is Category.TRACKER:
+        page_title = "African Election Tracker"
+    elif kind is Category.DATA:
+        page_title = "African Democracy Data"
+    elif kind is Category.DIRECTORY:
+        page_title = "Directory"
+    else:
+        # For democracy pages, do NOT use a tab title as fallback!
+        # Use slug-based fallback only if democracy_title is not present
+        page_title = democracy_title if democracy_title else (slug.replace("-", " ").capitalize())
+
+    page["_category"] = category
+    page["_category_kind"] = kind
+    page["_is_country_page"] = is_country_page
+    page["_page_title"] = page_title
+
+    for tab in page["tabs"]:
+        more_info = tab["tab_fields"].get("More info about this page", "")
+
+        # Dynamically generate more_info for specific country tabs if blank
+        if is_country_page and not more_info:
+            if tab["_title"] == "Context":
+                more_info = (
+                    f"This page offers a comprehensive overview of {country_name}'s government and political history "
+                    f"through two key interactive visualisations. The first section provides a detailed table showcasing "
+                    f"vital political and economic indicators, such as {country_name}'s population, GDP, government "
+                    f"structure, age and tenure of the current president, military regime status, and democracy metrics. <br><br>"
+                    f"The second section presents a historical and political chronology of {country_name}, highlighting "
+                    f"significant milestones such as independence, referendum history, coups, notable wars, and "
+                    f"democratic progress. Together, these visualisations provide a rich resource for understanding "
+                    f"{country_name}'s governance, leadership, and democratic evolution, catering to researchers, "
+                    f"policymakers, and anyone interested in African political history."
+                )
+        tab["_more_info"] = more_info
+
+
+def precompute_page_views():
+    """Sort tabs, subtabs and year groups once at load instead of per request"""
+    for slug, page in list(country_data.items()) + list(
+            democracy_data.items()):
+        # Sort tabs by TabOrder (ints are parsed once so sorts compare ints)
+        for tab in page["tabs"]:
+            tab["_order"] = int(tab["tab_fields"].get("TabOrder", "0") or 0)
+        page["tabs"].sort(key=itemgetter("_order"))
+        for tab in page["tabs"]:
+            tab["_title"] = tab["tab_fields"].get(
+                "TabTitle") or tab["tab_fields"].get("Democracy-tab") or ""
+            tab["_url_slug"] = tab_url_slug(tab["_title"])
+            # Sort subtabs by SubtabOrder
+            for subtab in tab["subtabs"]:
+                subtab["_order"] = int(subtab["subtab_fields"].get(
+                    "SubtabOrder", "0") or 0)
+            tab["subtabs"].sort(key=itemgetter("_order"))
+            for subtab in tab["subtabs"]:
+                for section in subtab["sections"]:
+                    section["_order"] = int(
+                        section.get("SectionOrder", "0") or 0)
+                subtab["_years"], subtab[
+                    "_sections_by_year"] = organize_sections_by_year(subtab)
+        # Navigation between the tabs of one page; a lone tab uses the page URL
+        page["_tab_links"] = [
+            (tab["_url_slug"], tab["_title"],
+             f"/{slug}-{tab['_url_slug']}" if len(page["tabs"]) > 1 else f"/{slug}")
+            for tab in page["tabs"]
+        ]
+        # Later tabs win on a duplicate slug, as the old linear scan did
+        page["_tab_by_slug"] = {
+            tab["_url_slug"]: (i, tab)
+            for i, tab in enumerate(page["tabs"])
+        }
+        describe_page(slug, page)
+
+
+precompute_page_views()
+
+
+def split_slug_parts(url):
+    """Split a URL on single hyphens, keeping double hyphens inside a part"""
+    temp_url = url.replace('--', '__DOUBLE_HYPHEN__')
+    return [
+        part.replace('__DOUBLE_HYPHEN__', '--')
+        for part in temp_url.split('-')
+    ]
+
+
+all_slugs = set(country_data) | set(democracy_data)
+# No page slug spans more parts than this, so longer prefixes can't match
+max_slug_parts = max((len(split_slug_parts(slug)) for slug in all_slugs),
+                     default=0)
+
+
+# Pre-encoded bodies for the 404s the page handlers raise
+NOT_FOUND_BODIES = {
+    detail: detail.encode()
+    for detail in ("Page not found", "Tab not found")
+}
+
+
+@app.exception_handler(404)
+async def not_found(request: Request, exc: HTTPException):
+    body = NOT_FOUND_BODIES.get(getattr(exc, "detail", None))
+    if body is None:
+        # Unrouted paths keep FastAPI's default response
+        return await http_exception_handler(request, exc)
+    return HTMLResponse(body, status_code=404)
+
+
 @app.get("/", response_class=HTMLResponse)
 async def homepage(request: Request):
-    tracker_pages, data_pages, directory_pages = categorize_democracy_pages()
-    # Sort countries alphabetically by country name
-    sorted_countries = dict(
-        sorted(country_data.items(),
-               key=lambda item: item[1]["page_fields"].get("Country", "").
-               lower()))
-    # Default to Upcoming Elections page
-    if tracker_pages:
-        first_tracker_slug = next(iter(tracker_pages))
+    # Default to Upcoming Elections page; the sidebar is only needed without one
+    first_tracker_slug = next(iter(tracker_pages), None)
+    if first_tracker_slug is not None:
         return RedirectResponse(url=f"/{first_tracker_slug}")
     return templates.TemplateResponse(
         "base.html", {
             "request": request,
-            "sidebar": {
-                "tracker": tracker_pages,
-                "democracy": data_pages,
-                "countries": sorted_countries,
-                "directory": directory_pages
-            },
-            "year": datetime.now().year
+            "sidebar": sidebar,
+            "year": current_year
         })
 
 
+# Generated sitemaps by base URL; the data behind them is fixed per process.
+# Kept small since the Host header is client-controlled.
+sitemap_cache = {}
+SITEMAP_CACHE_SIZE = 8
+
+
 @app.get("/sitemap.xml", response_class=Response)
 async def sitemap(request: Request):
-    from .sitemap import generate_sitemap
-    sitemap_xml = generate_sitemap(request)
+    base_url = str(request.base_url)
+    sitemap_xml = sitemap_cache.get(base_url)
+    if sitemap_xml is None:
+        if len(sitemap_cache) >= SITEMAP_CACHE_SIZE:
+            sitemap_cache.clear()
+        sitemap_xml = sitemap_cache[base_url] = generate_sitemap(request)
     return Response(content=sitemap_xml, media_type="application/xml")
 
 
 @app.get("/robots.txt", response_class=Response)
 async def robots_txt():
-    with open("siteV2/static/robots.txt", "r") as f:
-        content = f.read()
-    return Response(content=content, media_type="text/plain")
+    # FileResponse reads off the event loop (and can use sendfile)
+    return FileResponse("siteV2/static/robots.txt", media_type="text/plain")
 
 
 @app.get("/{hyphenated_url}", response_class=HTMLResponse)
 async def render_hyphenated_url(request: Request, hyphenated_url: str):
     # First check if it's a simple slug (no hyphens connecting parts)
-    if hyphenated_url in country_data or hyphenated_url in democracy_data:
-        return await render_simple_page(request, hyphenated_url)
+    if hyphenated_url in all_slugs:
+        return render_simple_page(request, hyphenated_url)
 
     # Parse hyphenated URL format: country-tab-slug-year or country-tab-slug
-    # Handle double hyphens by temporarily replacing them
-    temp_url = hyphenated_url.replace('--', '__DOUBLE_HYPHEN__')
-    parts = temp_url.split('-')
+    parts = split_slug_parts(hyphenated_url)
 
     # Try to extract year from the end
     year = None
@@ -162,201 +366,112 @@ async def render_hyphenated_url(request: Request, hyphenated_url: str):
     tab_slug = None
 
     # Try from longest possible country name to shortest
-    for i in range(len(parts), 0, -1):
-        potential_country = '-'.join(parts[:i]).replace(
-            '__DOUBLE_HYPHEN__', '--')
-        if potential_country in country_data or potential_country in democracy_data:
+    for i in range(min(len(parts), max_slug_parts), 0, -1):
+        potential_country = '-'.join(parts[:i])
+        if potential_country in all_slugs:
             country_slug = potential_country
             if i < len(parts):
-                tab_slug = '-'.join(parts[i:]).replace('__DOUBLE_HYPHEN__',
-                                                       '--')
+                tab_slug = '-'.join(parts[i:])
             break
 
     if not country_slug:
-        return HTMLResponse("Page not found", status_code=404)
+        raise HTTPException(status_code=404, detail="Page not found")
 
-    return await render_tab_page_with_year(request, country_slug, tab_slug,
-                                           year)
+    return render_tab_page_with_year(request, country_slug, tab_slug, year)
 
 
-async def render_simple_page(request: Request, slug: str):
-    tracker_pages, data_pages, directory_pages = categorize_democracy_pages()
-    sorted_countries = dict(
-        sorted(country_data.items(),
-               key=lambda item: item[1]["page_fields"].get("Country", "").
-               lower()))
+def render_simple_page(request: Request, slug: str):
     source = (country_data.get(slug) or democracy_data.get(slug))
     if not source:
-        return HTMLResponse("Page not found", status_code=404)
+        raise HTTPException(status_code=404, detail="Page not found")
 
     # For pages with multiple tabs, redirect to first tab
     if source.get("tabs") and len(source["tabs"]) > 1:
-        sorted_tabs = sorted(
-            source["tabs"],
-            key=lambda tab: int(tab["tab_fields"].get("TabOrder", "0")))
-        first_tab = sorted_tabs[0]
-        tab_title = first_tab["tab_fields"].get(
-            "TabTitle") or first_tab["tab_fields"].get("Democracy-tab")
-        tab_slug = tab_title.lower().replace(" ", "-").replace("&",
-                                                               "").replace(
-                                                                   "  ", "-")
-        hyphenated_url = f"{slug}-{tab_slug}"
+        hyphenated_url = f"{slug}-{source['tabs'][0]['_url_slug']}"
         return RedirectResponse(url=f"/{hyphenated_url}")
 
     # Single tab pages - render directly
-    return await render_tab_page_with_year(request, slug, None, None)
-
-
-async def render_tab_page_with_year(request: Request,
-                                    slug: str,
-                                    tab_slug: str = None,
-                                    year: str = None):
-    tracker_pages, data_pages, directory_pages = categorize_democracy_pages()
-    sorted_countries = dict(
-        sorted(country_data.items(),
-               key=lambda item: item[1]["page_fields"].get("Country", "").
-               lower()))
-    source = (country_data.get(slug) or democracy_data.get(slug))
-    if not source:
-        return HTMLResponse("Page not found", status_code=404)
+    return render_tab_page_with_year(request, slug, None, None)
 
-    # Get the category to determine template behavior
-    category = source["page_fields"].get("Category")
-    if not category and source.get("tabs"):
-        # Sort tabs by TabOrder before picking first tab for category fallback
-        sorted_tabs_for_category = sorted(
-            source["tabs"],
-            key=lambda tab: int(tab["tab_fields"].get("TabOrder", "0"))
-        )
-        category = sorted_tabs_for_category[0].get("tab_fields", {}).get("Category", "") if sorted_tabs_for_category else ""
 
-    country_name = source["page_fields"].get("Country")
-    democracy_title = source["page_fields"].get("Democracy-page")
+# Rendered tab pages that don't vary per request, by (slug, tab_slug, year)
+rendered_pages = {}
 
-    # Detect if this is a Country Data & History page by presence of Country but no Category
-    is_country_page = bool(country_name) and not bool(category)
 
-    if country_name:
-        page_title = f"Democracy in {country_name}"
-    elif category == "Election Tracker":
-        page_title = "African Election Tracker"
-    elif category == "Democracy Data":
-        page_title = "African Democracy Data"
-    elif category == "Directory of Country Resources":
-        page_title = "Directory"
-    else:
-        # For democracy pages, do NOT use a tab title as fallback!
-        # Use slug-based fallback only if democracy_title is not present, and not for tracker/data
-        page_title = democracy_title if (democracy_title and category not in ["Election Tracker", "Democracy Data"]) else (slug.replace("-", " ").capitalize())
+def render_tab_page_with_year(request: Request,
+                              slug: str,
+                              tab_slug: str = None,
+                              year: str = None):
+    cached_page = rendered_pages.get((slug, tab_slug, year))
+    if cached_page is not None:
+        return HTMLResponse(cached_page)
+
+    source = (country_data.get(slug) or democracy_data.get(slug))
+    if not source:
+        raise HTTPException(status_code=404, detail="Page not found")
 
-    # Sort tabs by TabOrder
-    sorted_tabs = sorted(
-        source["tabs"],
-        key=lambda tab: int(tab["tab_fields"].get("TabOrder", "0")))
+    category = source["_category"]
+    category_kind = source["_category_kind"]
+    is_country_page = source["_is_country_page"]
+    page_title = source["_page_title"]
 
-    # Find the specific tab to display
-    current_tab = None
-    current_tab_index = 0
-    tab_links = []
+    sorted_tabs = source["tabs"]
 
     # Generate navigation links based on page category
-    if category == "Election Tracker":
+    if category_kind is Category.TRACKER:
         # Show all Election Tracker pages as navigation
-        for page_slug, page_data in tracker_pages.items():
-            page_title_link = page_data["page_fields"].get("Democracy-page", "")
-            tab_links.append({
-                "title": page_title_link,
-                "url": f"/{page_slug}",
-                "is_active": page_slug == slug
-            })
-    elif category == "Democracy Data":
+        tab_links = [{
+            "title": title,
+            "url": url,
+            "is_active": page_slug == slug
+        } for page_slug, title, url in tracker_links]
+    elif category_kind is Category.DATA:
         # Show all Democracy Data pages as navigation
-        for page_slug, page_data in data_pages.items():
-            page_title_link = page_data["page_fields"].get("Democracy-page", "")
-            tab_links.append({
-                "title": page_title_link,
-                "url": f"/{page_slug}",
-                "is_active": page_slug == slug
-            })
+        tab_links = [{
+            "title": title,
+            "url": url,
+            "is_active": page_slug == slug
+        } for page_slug, title, url in data_links]
     else:
         # For other pages (like country pages), show tabs within the same page
-        for i, tab in enumerate(sorted_tabs):
-            tab_title = tab["tab_fields"].get(
-                "TabTitle") or tab["tab_fields"].get("Democracy-tab")
-            tab_url_slug = tab_title.lower().replace(" ", "-").replace(
-                "&", "").replace("  ", "-")
-
-            if len(sorted_tabs) > 1:
-                hyphenated_url = f"{slug}-{tab_url_slug}"
-                url = f"/{hyphenated_url}"
-            else:
-                url = f"/{slug}"
-
-            tab_links.append({
-                "title":
-                tab_title,
-                "url":
-                url,
-                "is_active":
-                tab_slug == tab_url_slug or (tab_slug is None and i == 0)
-            })
-
-    # Find current tab
-    for i, tab in enumerate(sorted_tabs):
-        tab_title = tab["tab_fields"].get("TabTitle") or tab["tab_fields"].get(
-            "Democracy-tab")
-        tab_url_slug = tab_title.lower().replace(" ",
-                                                 "-").replace("&", "").replace(
-                                                     "  ", "-")
-
-        if tab_slug == tab_url_slug or (tab_slug is None and i == 0):
-            current_tab = tab
-            current_tab_index = i
+        tab_links = [{
+            "title":
+            title,
+            "url":
+            url,
+            "is_active":
+            tab_slug == url_slug or (tab_slug is None and i == 0)
+        } for i, (url_slug, title, url) in enumerate(source["_tab_links"])]
+
+    # Find the specific tab to display, defaulting to the first one
+    if tab_slug is None:
+        current_tab_index, current_tab = (0, sorted_tabs[0]) if sorted_tabs else (0, None)
+    else:
+        current_tab_index, current_tab = source["_tab_by_slug"].get(
+            tab_slug, (0, None))
 
     if not current_tab:
-        return HTMLResponse("Tab not found", status_code=404)
+        raise HTTPException(status_code=404, detail="Tab not found")
 
     # Build structured tab data
-    tab_title = current_tab["tab_fields"].get(
-        "TabTitle") or current_tab["tab_fields"].get("Democracy-tab")
+    tab_title = current_tab["_title"]
     tab_text = current_tab["tab_fields"].get("TabText", "")
-    more_info = current_tab["tab_fields"].get("More info about this page", "")
-
-    # Dynamically generate more_info for specific country tabs if blank
-    if is_country_page and not more_info:
-        if tab_title == "Context":
-            more_info = (
-                f"This page offers a comprehensive overview of {country_name}'s government and political history "
-                f"through two key interactive visualisations. The first section provides a detailed table showcasing "
-                f"vital political and economic indicators, such as {country_name}'s population, GDP, government "
-                f"structure, age and tenure of the current president, military regime status, and democracy metrics. <br><br>"
-                f"The second section presents a historical and political chronology of {country_name}, highlighting "
-                f"significant milestones such as independence, referendum history, coups, notable wars, and "
-                f"democratic progress. Together, these visualisations provide a rich resource for understanding "
-                f"{country_name}'s governance, leadership, and democratic evolution, catering to researchers, "
-                f"policymakers, and anyone interested in African political history."
-            )
-
-    # Sort subtabs by SubtabOrder
-    sorted_subtabs = sorted(current_tab["subtabs"],
-                            key=lambda subtab: int(subtab["subtab_fields"].get(
-                                "SubtabOrder", "0")))
+    more_info = current_tab["_more_info"]
 
     subtabs = []
-    for subtab in sorted_subtabs:
+    for subtab in current_tab["subtabs"]:
         subtab_title = subtab["subtab_fields"].get("SubtabTitle")
         subtab_text = subtab["subtab_fields"].get("SubtabText")
 
-        years, sections_by_year = organize_sections_by_year(subtab)
         subtabs.append({
             "title":
             subtab_title,
             "text":
             subtab_text,
             "years":
-            years,
+            subtab["_years"],
             "sections_by_year":
-            sections_by_year,
+            subtab["_sections_by_year"],
             "democracy_description":
             subtab["subtab_fields"].get("Description")
         })
@@ -368,24 +483,31 @@ async def render_tab_page_with_year(request: Request,
         "subtabs": subtabs
     }
 
-    return templates.TemplateResponse(
-        "tab_page.html", {
-            "request": request,
-            "page_title": page_title,
-            "country_description": source["page_fields"].get("Text"),
-            "current_tab": current_tab_data,
-            "tab_links": tab_links,
-            "category": category,
-            "current_slug": slug,
-            "current_tab_slug": tab_slug,
-            "selected_year": year,
-            "sidebar": {
-                "tracker": tracker_pages,
-                "democracy": data_pages,
-                "countries": sorted_countries,
-                "directory": directory_pages
-            },
-            "year": datetime.now().year,
-            "version": datetime.now().timestamp(),
-            "is_country_page": is_country_page
-        })
\ No newline at end of file
+    context = {
+        "request": request,
+        "page_title": page_title,
+        "country_description": source["page_fields"].get("Text"),
+        "current_tab": current_tab_data,
+        "tab_links": tab_links,
+        "category": category,
+        "current_slug": slug,
+        "current_tab_slug": tab_slug,
+        "selected_year": year,
+        "sidebar": sidebar,
+        "year": current_year,
+        "version": asset_version,
+        "is_country_page": is_country_page
+    }
+
+    # Tracker, data and directory pages depend only on the data file, so
+    # render them once. Only years the page has are cached, since the year in
+    # the URL is client-controlled.
+    if (category_kind is not Category.OTHER and not is_country_page
+            and (year is None
+                 or any(year in subtab["years"] for subtab in subtabs))):
+        cached_page = templates.get_template("tab_page.html").render(
+            context).encode()
+        rendered_pages[(slug, tab_slug, year)] = cached_page
+        return HTMLResponse(cached_page)
+
+    return templates.TemplateResponse("tab_page.html", context)
\ No newline at end of file